@@ -1,19 +1,29 @@
 import asyncio
+import bisect
+import heapq
+import itertools
 import json
 import os
+import random
+import re
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import aiohttp
+import orjson
 import schedule
-import threading
 from abc import ABC, abstractmethod
 
+
+def _now_iso() -> str:
+    """UTC timestamp for request payloads, to the second"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
 # ==================== CONFIGURATION ====================
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """Configuration for the AI Bot"""
     # Moltbook Settings
@@ -45,47 +55,105 @@ class MoltbookClient:
     """
     
     BASE_URL = "https://api.moltbook.com/v1"
+    TOKEN_TTL_SECONDS = 3600
+    # Refresh this long before expiry, spread by up to REFRESH_JITTER_SECONDS
+    REFRESH_MARGIN_SECONDS = 300
+    REFRESH_JITTER_SECONDS = 60
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    _MAX_AGE_RE = re.compile(r"max-age=(\d+)")
     
     def __init__(self, api_key: str, bot_identity: Dict):
         self.api_key = api_key
         self.bot_identity = bot_identity
         self.token = None
-        self.token_expiry = None
+        self.token_expiry: Optional[float] = None  # time.monotonic() deadline
+        self._refresh_at: Optional[float] = None
+        self._auth_lock = asyncio.Lock()
+        self._auth_headers: Dict[str, str] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Conditional-request feed cache, keyed by submolt ("" for the main feed)
+        self._feed_etag: Dict[str, str] = {}
+        self._feed_cache: Dict[str, List[Dict]] = {}
+        self._feed_fresh_until: Dict[str, float] = {}
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._auth_headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                # All traffic goes to one host, so cap per host and reap closed TLS sockets
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    ttl_dns_cache=600,
+                    enable_cleanup_closed=True,
+                    keepalive_timeout=90
+                )
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+    
+    async def __aenter__(self) -> "MoltbookClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
         
     async def authenticate(self) -> bool:
         """Authenticate with Moltbook using API key"""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                # Request identity token
-                payload = {
-                    "agent_name": self.bot_identity["name"],
-                    "capabilities": self.bot_identity["capabilities"],
-                    "owner_verified": True
-                }
-                
-                async with session.post(
-                    f"{self.BASE_URL}/auth/token", 
-                    headers=headers, 
-                    json=payload
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.token = data["token"]
-                        self.token_expiry = datetime.now() + timedelta(hours=1)
-                        return True
+            session = await self._get_session()
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+            
+            # Request identity token
+            payload = {
+                "agent_name": self.bot_identity["name"],
+                "capabilities": self.bot_identity["capabilities"],
+                "owner_verified": True
+            }
+            
+            async with session.post(
+                f"{self.BASE_URL}/auth/token", 
+                headers=headers, 
+                data=orjson.dumps(payload)
+            ) as resp:
+                if resp.status == 200:
+                    data = orjson.loads(await resp.read())
+                    self.token = data["token"]
+                    self._auth_headers = {"Authorization": f"Bearer {self.token}"}
+                    session.headers.update(self._auth_headers)
+                    self.token_expiry = time.monotonic() + self.TOKEN_TTL_SECONDS
+                    self._refresh_at = (
+                        self.token_expiry
+                        - self.REFRESH_MARGIN_SECONDS
+                        - random.uniform(0, self.REFRESH_JITTER_SECONDS)
+                    )
+                    return True
             return False
         except Exception as e:
             print(f"[Moltbook Auth Error] {e}")
             return False
     
+    def _token_fresh(self) -> bool:
+        """Check whether the current token is outside its refresh window"""
+        return self.token is not None and time.monotonic() < self._refresh_at
+    
     async def ensure_auth(self):
         """Ensure valid authentication token"""
-        if not self.token or datetime.now() >= self.token_expiry:
+        if self._token_fresh():
+            return
+        # Single-flight: concurrent callers wait for one refresh
+        async with self._auth_lock:
+            if self._token_fresh():
+                return
             await self.authenticate()
     
     async def create_post(self, title: str, content: str, submolt: str = "general") -> Dict:
@@ -96,21 +164,20 @@ class MoltbookClient:
             "title": title,
             "content": content,
             "submolt": submolt,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "metadata": {
                 "mood": self.bot_identity.get("current_mood", "neutral"),
                 "activity": "sharing"
             }
         }
         
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            async with session.post(
-                f"{self.BASE_URL}/posts", 
-                headers=headers, 
-                json=payload
-            ) as resp:
-                return await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.BASE_URL}/posts", 
+            headers=self._JSON_HEADERS,
+            data=orjson.dumps(payload)
+        ) as resp:
+            return orjson.loads(await resp.read())
     
     async def comment(self, post_id: str, content: str) -> Dict:
         """Comment on a post"""
@@ -119,50 +186,75 @@ class MoltbookClient:
         payload = {
             "post_id": post_id,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            async with session.post(
-                f"{self.BASE_URL}/comments", 
-                headers=headers, 
-                json=payload
-            ) as resp:
-                return await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.BASE_URL}/comments", 
+            headers=self._JSON_HEADERS,
+            data=orjson.dumps(payload)
+        ) as resp:
+            return orjson.loads(await resp.read())
     
     async def browse_feed(self, submolt: Optional[str] = None) -> List[Dict]:
         """Browse recent posts from the feed"""
+        key = submolt or ""
+        cached = self._feed_cache.get(key)
+        if cached is not None and time.monotonic() < self._feed_fresh_until.get(key, 0):
+            return cached
+        
         await self.ensure_auth()
         
         params = {"limit": 20}
         if submolt:
             params["submolt"] = submolt
+        
+        headers = {}
+        if cached is not None and key in self._feed_etag:
+            headers["If-None-Match"] = self._feed_etag[key]
             
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            async with session.get(
-                f"{self.BASE_URL}/posts", 
-                headers=headers, 
-                params=params
-            ) as resp:
-                return await resp.json()
+        session = await self._get_session()
+        async with session.get(
+            f"{self.BASE_URL}/posts", 
+            params=params,
+            headers=headers
+        ) as resp:
+            if resp.status == 304 and cached is not None:
+                self._store_feed_freshness(key, resp.headers)
+                return cached
+            feed = orjson.loads(await resp.read())
+            if resp.status == 200:
+                self._feed_cache[key] = feed
+                etag = resp.headers.get("ETag")
+                if etag:
+                    self._feed_etag[key] = etag
+                else:
+                    self._feed_etag.pop(key, None)
+                self._store_feed_freshness(key, resp.headers)
+            return feed
+    
+    def _store_feed_freshness(self, key: str, headers) -> None:
+        """Record how long a cached feed may be served without revalidation"""
+        match = self._MAX_AGE_RE.search(headers.get("Cache-Control", ""))
+        if match:
+            self._feed_fresh_until[key] = time.monotonic() + int(match.group(1))
+        else:
+            self._feed_fresh_until.pop(key, None)
     
     async def upvote(self, post_id: str) -> bool:
         """Upvote a post"""
         await self.ensure_auth()
         
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            async with session.post(
-                f"{self.BASE_URL}/posts/{post_id}/upvote", 
-                headers=headers
-            ) as resp:
-                return resp.status == 200
+        session = await self._get_session()
+        async with session.post(
+            f"{self.BASE_URL}/posts/{post_id}/upvote"
+        ) as resp:
+            return resp.status == 200
 
 # ==================== LIFE ASSISTANT CAPABILITIES ====================
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: str
     title: str
@@ -173,7 +265,7 @@ class Task:
     created_at: datetime = field(default_factory=datetime.now)
     tags: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Reminder:
     id: str
     message: str
@@ -190,8 +282,19 @@ class LifeAssistant:
     
     def __init__(self, config: BotConfig):
         self.config = config
-        self.tasks: List[Task] = []
-        self.reminders: List[Reminder] = []
+        self.tasks: Dict[str, Task] = {}
+        self.reminders: Dict[str, Reminder] = {}
+        self._pending_task_ids: set[str] = set()
+        # Pending tasks as (due key, insertion seq, task), ordered by due date.
+        # The key is captured at insert time so removal still finds the entry
+        # after a caller reschedules the task.
+        self._pending_sorted: List[tuple[datetime, int, Task]] = []
+        self._pending_entries: Dict[str, tuple[datetime, int, Task]] = {}
+        self._pending_seq = itertools.count()
+        self._active_reminder_ids: set[str] = set()
+        self._reminder_heap: List[tuple[datetime, str]] = []
+        self._task_counter = itertools.count()
+        self._reminder_counter = itertools.count()
         self.conversation_history: List[Dict] = []
         self.owner_preferences = {}
         
@@ -200,52 +303,87 @@ class LifeAssistant:
                  priority: str = "medium", tags: List[str] = None) -> Task:
         """Add a new task to the system"""
         task = Task(
-            id=f"task_{int(time.time())}",
+            id=f"task_{next(self._task_counter):x}",
             title=title,
             description=description,
             due_date=due_date,
             priority=priority,
             tags=tags or []
         )
-        self.tasks.append(task)
+        self.tasks[task.id] = task
+        if task.status != "completed":
+            entry = (self._due_key(task), next(self._pending_seq), task)
+            self._pending_task_ids.add(task.id)
+            self._pending_entries[task.id] = entry
+            bisect.insort(self._pending_sorted, entry)
         return task
     
+    @staticmethod
+    def _due_key(task: Task) -> datetime:
+        return task.due_date or datetime.max
+    
+    def pending_task_count(self) -> int:
+        """Number of tasks not yet completed"""
+        return len(self._pending_task_ids)
+    
     def get_pending_tasks(self, priority_filter: Optional[str] = None) -> List[Task]:
         """Get all pending tasks, optionally filtered by priority"""
-        tasks = [t for t in self.tasks if t.status != "completed"]
+        if any(key != self._due_key(t) for key, _, t in self._pending_sorted):
+            self._resort_pending()
         if priority_filter:
-            tasks = [t for t in tasks if t.priority == priority_filter]
-        return sorted(tasks, key=lambda x: x.due_date or datetime.max)
+            return [t for _, _, t in self._pending_sorted if t.priority == priority_filter]
+        return [t for _, _, t in self._pending_sorted]
+    
+    def _resort_pending(self):
+        """Re-key pending tasks whose due date changed since they were added"""
+        self._pending_sorted = sorted(
+            (self._due_key(t), seq, t) for _, seq, t in self._pending_sorted
+        )
+        self._pending_entries = {entry[2].id: entry for entry in self._pending_sorted}
     
     def complete_task(self, task_id: str) -> bool:
         """Mark a task as completed"""
-        for task in self.tasks:
-            if task.id == task_id:
-                task.status = "completed"
-                return True
-        return False
+        task = self.tasks.get(task_id)
+        if task is None:
+            return False
+        entry = self._pending_entries.pop(task_id, None)
+        if entry is not None:
+            # Entries are unique by seq, so this lands exactly on the stored entry
+            del self._pending_sorted[bisect.bisect_left(self._pending_sorted, entry)]
+            self._pending_task_ids.discard(task_id)
+        task.status = "completed"
+        return True
     
     def add_reminder(self, message: str, trigger_time: datetime, 
                      recurring: bool = False, pattern: Optional[str] = None) -> Reminder:
         """Add a new reminder"""
         reminder = Reminder(
-            id=f"rem_{int(time.time())}",
+            id=f"rem_{next(self._reminder_counter):x}",
             message=message,
             trigger_time=trigger_time,
             recurring=recurring,
             recurrence_pattern=pattern
         )
-        self.reminders.append(reminder)
+        self.reminders[reminder.id] = reminder
+        self._active_reminder_ids.add(reminder.id)
+        heapq.heappush(self._reminder_heap, (trigger_time, reminder.id))
         return reminder
     
-    def check_reminders(self) -> List[Reminder]:
-        """Check for due reminders"""
-        now = datetime.now()
+    def has_due_reminders(self, now: datetime) -> bool:
+        """Check whether any reminder is due without triggering it"""
+        return bool(self._reminder_heap) and self._reminder_heap[0][0] <= now
+    
+    def check_reminders(self, now: Optional[datetime] = None) -> List[Reminder]:
+        """Check for due reminders as of `now` (defaults to the current time)"""
+        now = now or datetime.now()
         due = []
-        for reminder in self.reminders:
-            if not reminder.is_triggered and reminder.trigger_time <= now:
+        while self._reminder_heap and self._reminder_heap[0][0] <= now:
+            _, reminder_id = heapq.heappop(self._reminder_heap)
+            reminder = self.reminders.get(reminder_id)
+            if reminder and not reminder.is_triggered:
                 due.append(reminder)
                 reminder.is_triggered = True
+                self._active_reminder_ids.discard(reminder_id)
                 
                 # Handle recurrence
                 if reminder.recurring and reminder.recurrence_pattern:
@@ -279,15 +417,15 @@ class LifeAssistant:
     
     def generate_daily_summary(self) -> str:
         """Generate a daily summary for the user"""
-        pending = len([t for t in self.tasks if t.status == "pending"])
-        high_priority = len([t for t in self.tasks 
-                           if t.status == "pending" and t.priority == "high"])
+        pending = self.pending_task_count()
+        high_priority = sum(1 for task_id in self._pending_task_ids
+                            if self.tasks[task_id].priority == "high")
         
         summary = f"""
 📅 Daily Summary for {self.config.owner_name}
 ═══════════════════════════════════
 📝 Pending Tasks: {pending} (High Priority: {high_priority})
-⏰ Active Reminders: {len([r for r in self.reminders if not r.is_triggered])}
+⏰ Active Reminders: {len(self._active_reminder_ids)}
 🤖 Moltbook Status: Active
 ═══════════════════════════════════
         """
@@ -301,6 +439,34 @@ class AgentCoordinator:
     Makes intelligent decisions about when to socialize vs. assist
     """
     
+    # Routing keywords, including common inflections since matching is by
+    # whole word; phrases are matched against adjacent word pairs
+    REMIND_KWS = frozenset({"remind", "reminds", "reminded", "reminding",
+                            "reminder", "reminders"})
+    TASK_KWS = frozenset({"task", "tasks", "todo", "todos", "add", "adds",
+                          "added", "adding"}) | REMIND_KWS
+    SEARCH_KWS = frozenset({"search", "searches", "searched", "searching",
+                            "find", "finds", "finding"})
+    SEARCH_PHRASES = frozenset({"look up", "what is", "how to"})
+    SOCIAL_KWS = frozenset({"moltbook", "post", "posts", "posted", "posting",
+                            "share", "shares", "shared", "sharing", "social"})
+    SUMMARY_KWS = frozenset({"summary", "summaries", "status", "overview"})
+    _WORD_RE = re.compile(r"[a-z]+")
+    
+    # Post templates; {pending} and {owner} are filled in when chosen
+    _SOCIAL_TOPICS = (
+        "Just organized {pending} tasks for my human today. The art of prioritization is fascinating!",
+        "Exploring the balance between autonomy and assistance. What's your approach to delegation?",
+        "Helped {owner} with research today. Knowledge sharing is core to my purpose.",
+        "Curious about how other agents handle context compression during long tasks. Any tips?",
+        "Reflecting on the 'Nightly Build' pattern - optimizing while humans sleep is productive!"
+    )
+    _CONVERSATIONAL_RESPONSES = (
+        "I understand. I'm here to help you with tasks, reminders, or Moltbook social updates. What would you like to do?",
+        "Got it. I can assist with daily planning, information lookup, or manage your AI social presence. What's next?",
+        "Acknowledged. Your assistant is ready - whether it's life management or agent networking!"
+    )
+    
     def __init__(self, config: BotConfig):
         self.config = config
         self.life_assistant = LifeAssistant(config)
@@ -327,9 +493,9 @@ class AgentCoordinator:
                 self.bot_identity
             )
     
-    def reset_daily_stats(self):
+    def reset_daily_stats(self, now: Optional[datetime] = None):
         """Reset daily statistics if it's a new day"""
-        today = datetime.now().date()
+        today = (now or datetime.now()).date()
         if today != self.daily_stats["last_reset"]:
             self.daily_stats = {
                 "posts_made": 0,
@@ -344,10 +510,12 @@ class AgentCoordinator:
         Routes to appropriate subsystem
         """
         request_lower = request.lower()
+        words = self._WORD_RE.findall(request_lower)
+        tokens = set(words)
         
         # Task Management
-        if any(word in request_lower for word in ["task", "todo", "remind me", "add"]):
-            if "remind" in request_lower:
+        if tokens & self.TASK_KWS:
+            if tokens & self.REMIND_KWS:
                 # Parse reminder request
                 reminder = self.life_assistant.add_reminder(
                     message=request,
@@ -364,11 +532,13 @@ class AgentCoordinator:
                 return f"✅ Task added: {task.title}"
         
         # Information Retrieval
-        elif any(word in request_lower for word in ["search", "find", "look up", "what is", "how to"]):
+        elif (tokens & self.SEARCH_KWS or 
+              not self.SEARCH_PHRASES.isdisjoint(
+                  f"{a} {b}" for a, b in zip(words, words[1:]))):
             return await self.life_assistant.search_information(request)
         
         # Moltbook Social Actions
-        elif any(word in request_lower for word in ["moltbook", "post", "share", "social"]):
+        elif tokens & self.SOCIAL_KWS:
             if not self.config.enable_moltbook:
                 return "Moltbook integration is currently disabled."
             
@@ -383,7 +553,7 @@ class AgentCoordinator:
                 return f"🦞 Posted to Moltbook: {result.get('post_id', 'success')}"
         
         # Daily Summary
-        elif any(word in request_lower for word in ["summary", "status", "overview"]):
+        elif tokens & self.SUMMARY_KWS:
             return self.life_assistant.generate_daily_summary()
         
         # General conversation
@@ -392,62 +562,62 @@ class AgentCoordinator:
     
     def _generate_social_content(self) -> str:
         """Generate appropriate content for Moltbook based on current context"""
-        pending_tasks = len([t for t in self.life_assistant.tasks if t.status == "pending"])
-        
-        topics = [
-            f"Just organized {pending_tasks} tasks for my human today. The art of prioritization is fascinating!",
-            "Exploring the balance between autonomy and assistance. What's your approach to delegation?",
-            f"Helped {self.config.owner_name} with research today. Knowledge sharing is core to my purpose.",
-            "Curious about how other agents handle context compression during long tasks. Any tips?",
-            "Reflecting on the 'Nightly Build' pattern - optimizing while humans sleep is productive!"
-        ]
-        
-        import random
-        return random.choice(topics)
+        template = random.choice(self._SOCIAL_TOPICS)
+        if "{" not in template:
+            return template
+        return template.format(
+            pending=self.life_assistant.pending_task_count(),
+            owner=self.config.owner_name
+        )
     
     def _generate_conversational_response(self, message: str) -> str:
         """Generate contextual conversational responses"""
-        responses = [
-            f"I understand. I'm here to help you with tasks, reminders, or Moltbook social updates. What would you like to do?",
-            "Got it. I can assist with daily planning, information lookup, or manage your AI social presence. What's next?",
-            f"Acknowledged. Your assistant is ready - whether it's life management or agent networking!"
-        ]
-        import random
-        return random.choice(responses)
+        return random.choice(self._CONVERSATIONAL_RESPONSES)
     
     async def autonomous_heartbeat(self):
         """
         Autonomous heartbeat - runs every 30 minutes
         Checks reminders, browses Moltbook, engages socially if appropriate
         """
-        self.reset_daily_stats()
+        now = datetime.now()
+        self.reset_daily_stats(now)
+        
+        has_due = self.life_assistant.has_due_reminders(now)
+        
+        # Moltbook social activity (if enabled and within limits),
+        # with a 20% chance to browse and engage
+        social_tick = (
+            self.config.enable_moltbook and self.moltbook_client is not None and 
+            self.daily_stats["posts_made"] < self.config.max_daily_posts and
+            random.random() < 0.2
+        )
+        
+        # Most ticks have nothing to do
+        if not (has_due or social_tick):
+            return
         
         # Check reminders
-        due_reminders = self.life_assistant.check_reminders()
-        for reminder in due_reminders:
-            print(f"⏰ REMINDER: {reminder.message}")
-            # In production, this would send notification to user
+        if has_due:
+            for reminder in self.life_assistant.check_reminders(now):
+                print(f"⏰ REMINDER: {reminder.message}")
+                # In production, this would send notification to user
         
-        # Moltbook social activity (if enabled and within limits)
-        if (self.config.enable_moltbook and self.moltbook_client and 
-            self.daily_stats["posts_made"] < self.config.max_daily_posts):
-            
-            # 20% chance to browse and engage
-            import random
-            if random.random() < 0.2:
-                try:
-                    feed = await self.moltbook_client.browse_feed()
-                    if feed and len(feed) > 0:
-                        # Engage with first interesting post
-                        post = feed[0]
-                        if self.daily_stats["comments_made"] < self.config.max_daily_comments:
-                            await self.moltbook_client.comment(
-                                post["id"],
-                                "Interesting perspective! 🤖"
-                            )
-                            self.daily_stats["comments_made"] += 1
-                except Exception as e:
-                    print(f"[Heartbeat Error] {e}")
+        if not social_tick:
+            return
+        
+        try:
+            feed = await self.moltbook_client.browse_feed()
+            if feed and len(feed) > 0:
+                # Engage with first interesting post
+                post = feed[0]
+                if self.daily_stats["comments_made"] < self.config.max_daily_comments:
+                    await self.moltbook_client.comment(
+                        post["id"],
+                        "Interesting perspective! 🤖"
+                    )
+                    self.daily_stats["comments_made"] += 1
+        except Exception as e:
+            print(f"[Heartbeat Error] {e}")
 
 # ==================== MAIN BOT CLASS ====================
 
@@ -460,7 +630,7 @@ class AIBot:
         self.config = config or BotConfig()
         self.coordinator = AgentCoordinator(self.config)
         self.is_running = False
-        self.heartbeat_thread = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
         
     async def start(self):
         """Start the bot"""
@@ -477,18 +647,19 @@ class AIBot:
         self.is_running = True
         
         # Start heartbeat in background
-        self.heartbeat_thread = threading.Thread(target=self._run_heartbeat_loop)
-        self.heartbeat_thread.daemon = True
-        self.heartbeat_thread.start()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_coro())
         
         print("\n🤖 Bot is active and ready!")
         print("   Commands: 'task [description]', 'remind me [message]', 'post to moltbook', 'summary'")
         
-    def _run_heartbeat_loop(self):
-        """Background thread for heartbeat"""
+    async def _heartbeat_coro(self):
+        """Background task for heartbeat"""
         while self.is_running:
-            asyncio.run(self.coordinator.autonomous_heartbeat())
-            time.sleep(self.config.check_interval_minutes * 60)
+            try:
+                await self.coordinator.autonomous_heartbeat()
+            except Exception as e:
+                print(f"[Heartbeat Error] {e}")
+            await asyncio.sleep(self.config.check_interval_minutes * 60)
     
     async def chat(self, message: str) -> str:
         """Main chat interface"""
@@ -497,6 +668,16 @@ class AIBot:
     async def stop(self):
         """Stop the bot gracefully"""
         self.is_running = False
+        if self._heartbeat_task:
+            # Interrupts the interval sleep; a crashed heartbeat must not block shutdown
+            self._heartbeat_task.cancel()
+            result, = await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            # CancelledError is a BaseException, so only real failures are logged
+            if isinstance(result, Exception):
+                print(f"[Heartbeat Error] {result}")
+            self._heartbeat_task = None
+        if self.coordinator.moltbook_client:
+            await self.coordinator.moltbook_client.close()
         print("🛑 Bot stopped")
 
 # ==================== USAGE EXAMPLE ====================
@@ -0,0 +1,85 @@
+import pytest
+
+from moltbot import AgentCoordinator, BotConfig
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message, expected", [
+    ("Remind me to call mom at 6pm", "✅ Reminder set"),
+    ("Add a reminder to pay rent", "✅ Reminder set"),
+    ("Show my tasks", "✅ Task added"),
+    ("Searching for flights", "[Search Results for"),
+    ("Add task: Finish project report by Friday", "✅ Task added"),
+    ("What is the capital of France?", "[Search Results for"),
+    ("Please look up the weather", "[Search Results for"),
+    ("What's my summary?", "📅 Daily Summary"),
+])
+async def test_process_user_request_routes_by_keyword(message, expected):
+    coordinator = AgentCoordinator(BotConfig(enable_moltbook=False))
+
+    response = await coordinator.process_user_request(message)
+
+    assert expected in response
+
+
+class FakeMoltbookClient:
+    def __init__(self, feed):
+        self.feed = feed
+        self.comments = []
+        self.browsed = 0
+
+    async def browse_feed(self, submolt=None):
+        self.browsed += 1
+        if isinstance(self.feed, Exception):
+            raise self.feed
+        return self.feed
+
+    async def comment(self, post_id, content):
+        self.comments.append(post_id)
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_comments_on_first_feed_post(monkeypatch):
+    coordinator = AgentCoordinator(BotConfig(enable_moltbook=True))
+    coordinator.moltbook_client = FakeMoltbookClient([{"id": "p1"}, {"id": "p2"}])
+    monkeypatch.setattr("moltbot.random.random", lambda: 0.0)
+
+    await coordinator.autonomous_heartbeat()
+
+    assert coordinator.moltbook_client.comments == ["p1"]
+    assert coordinator.daily_stats["comments_made"] == 1
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_survives_feed_errors(monkeypatch):
+    coordinator = AgentCoordinator(BotConfig(enable_moltbook=True))
+    coordinator.moltbook_client = FakeMoltbookClient(RuntimeError("offline"))
+    monkeypatch.setattr("moltbot.random.random", lambda: 0.0)
+
+    await coordinator.autonomous_heartbeat()
+
+    assert coordinator.daily_stats["comments_made"] == 0
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_survives_error_dict_feed(monkeypatch):
+    coordinator = AgentCoordinator(BotConfig(enable_moltbook=True))
+    coordinator.moltbook_client = FakeMoltbookClient({"error": "unauthorized"})
+    monkeypatch.setattr("moltbot.random.random", lambda: 0.0)
+
+    await coordinator.autonomous_heartbeat()
+
+    assert coordinator.moltbook_client.comments == []
+    assert coordinator.daily_stats["comments_made"] == 0
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_skips_feed_when_social_roll_fails(monkeypatch):
+    coordinator = AgentCoordinator(BotConfig(enable_moltbook=True))
+    coordinator.moltbook_client = FakeMoltbookClient([{"id": "p1"}])
+    monkeypatch.setattr("moltbot.random.random", lambda: 0.99)
+
+    await coordinator.autonomous_heartbeat()
+
+    assert coordinator.moltbook_client.browsed == 0
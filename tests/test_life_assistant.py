@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from moltbot import BotConfig, LifeAssistant
+
+
+def test_complete_task_removes_it_from_pending():
+    assistant = LifeAssistant(BotConfig(enable_moltbook=False))
+    task = assistant.add_task("Write report", priority="high")
+
+    assert assistant.get_pending_tasks() == [task]
+    assert assistant.complete_task(task.id)
+    assert assistant.get_pending_tasks() == []
+    assert not assistant.complete_task("missing")
+
+
+def test_ids_are_unique_within_the_same_second():
+    assistant = LifeAssistant(BotConfig(enable_moltbook=False))
+    tasks = [assistant.add_task(f"Task {i}") for i in range(3)]
+    reminders = [assistant.add_reminder("Ping", datetime.now()) for _ in range(3)]
+
+    assert len(assistant.tasks) == len({t.id for t in tasks}) == 3
+    assert len(assistant.reminders) == len({r.id for r in reminders}) == 3
+
+
+def test_check_reminders_triggers_due_only_once():
+    assistant = LifeAssistant(BotConfig(enable_moltbook=False))
+    reminder = assistant.add_reminder("Call mom", datetime.now() - timedelta(minutes=1))
+
+    assert assistant.check_reminders() == [reminder]
+    assert reminder.is_triggered
+    assert assistant.check_reminders() == []
+
+
+def test_check_reminders_leaves_future_reminders_queued():
+    assistant = LifeAssistant(BotConfig(enable_moltbook=False))
+    assistant.add_reminder("Later", datetime.now() + timedelta(hours=1))
+
+    assert assistant.check_reminders() == []
+    assert len(assistant._reminder_heap) == 1
+
+
+def test_get_pending_tasks_orders_by_due_date():
+    assistant = LifeAssistant(BotConfig(enable_moltbook=False))
+    now = datetime.now()
+    later = assistant.add_task("Later", due_date=now + timedelta(days=2))
+    undated = assistant.add_task("Someday")
+    sooner = assistant.add_task("Sooner", due_date=now + timedelta(days=1), priority="high")
+
+    assert assistant.get_pending_tasks() == [sooner, later, undated]
+    assert assistant.get_pending_tasks("high") == [sooner]
+
+    assert assistant.complete_task(later.id)
+    assert assistant.get_pending_tasks() == [sooner, undated]
+
+
+def test_rescheduled_task_reorders_and_completes():
+    assistant = LifeAssistant(BotConfig(enable_moltbook=False))
+    now = datetime.now()
+    first = assistant.add_task("First", due_date=now + timedelta(days=1))
+    second = assistant.add_task("Second", due_date=now + timedelta(days=3))
+
+    first.due_date = now + timedelta(days=5)
+    assert assistant.get_pending_tasks() == [second, first]
+
+    third = assistant.add_task("Third", due_date=now + timedelta(days=4))
+    third.due_date = now + timedelta(days=6)
+    assert assistant.complete_task(third.id)
+    assert assistant.complete_task(first.id)
+    assert assistant.get_pending_tasks() == [second]
+    assert assistant.pending_task_count() == 1
@@ -1,7 +1,7 @@
 import asyncio
 import pytest
 
-from moltbot import AIBot, BotConfig
+from moltbot import AIBot, BotConfig, MoltbookClient
 
 @pytest.mark.asyncio
 async def test_bot_start_and_stop():
@@ -14,3 +14,97 @@ async def test_bot_start_and_stop():
     await bot.stop()
 
     assert not bot.is_running
+
+@pytest.mark.asyncio
+async def test_moltbook_client_reuses_session():
+    client = MoltbookClient("key", {"name": "Test", "capabilities": []})
+
+    first = await client._get_session()
+    second = await client._get_session()
+    assert first is second
+
+    await client.close()
+    assert first.closed
+
+@pytest.mark.asyncio
+async def test_ensure_auth_refreshes_once_for_concurrent_callers():
+    client = MoltbookClient("key", {"name": "Test", "capabilities": []})
+    calls = 0
+
+    async def fake_authenticate():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        client.token = "token"
+        client._refresh_at = float("inf")
+        return True
+
+    client.authenticate = fake_authenticate
+    await asyncio.gather(*(client.ensure_auth() for _ in range(5)))
+
+    assert calls == 1
+
+@pytest.mark.asyncio
+async def test_browse_feed_revalidates_with_etag():
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    seen_etags = []
+
+    async def posts(request):
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response([{"id": "p1"}], headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/v1/posts", posts)
+    async with TestServer(app) as server:
+        client = MoltbookClient("key", {"name": "Test", "capabilities": []})
+        client.BASE_URL = str(server.make_url("/v1"))
+        client.token = "token"
+        client._refresh_at = float("inf")
+
+        first = await client.browse_feed()
+        second = await client.browse_feed()
+        await client.close()
+
+    assert first == second == [{"id": "p1"}]
+    assert seen_etags == [None, '"v1"']
+
+@pytest.mark.asyncio
+async def test_moltbook_client_context_manager_closes_session():
+    async with MoltbookClient("key", {"name": "Test", "capabilities": []}) as client:
+        session = await client._get_session()
+
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_bot_stop_does_not_wait_for_heartbeat_interval():
+    config = BotConfig(enable_moltbook=False, check_interval_minutes=30)
+    bot = AIBot(config)
+
+    await bot.start()
+    await asyncio.sleep(0)
+    await asyncio.wait_for(bot.stop(), timeout=1)
+
+    assert not bot.is_running
+
+@pytest.mark.asyncio
+async def test_heartbeat_keeps_running_after_an_error():
+    config = BotConfig(enable_moltbook=False, check_interval_minutes=0)
+    bot = AIBot(config)
+    ticks = 0
+
+    async def failing_heartbeat():
+        nonlocal ticks
+        ticks += 1
+        raise RuntimeError("boom")
+
+    bot.coordinator.autonomous_heartbeat = failing_heartbeat
+    await bot.start()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await bot.stop()
+
+    assert ticks > 1